@@ -18,7 +18,7 @@ from .config import CONFIG_FILE, Config
 from .executor import execute_task
 from .models import TaskStatus
 from .parser import parse_all_tasks, parse_file
-from .writer import create_report, update_task_state
+from .writer import record_execution
 
 
 def _load_config() -> Config:
@@ -183,11 +183,10 @@ def run(task_name: str | None, file_path: str | None) -> None:
         parameters=task.parameters,
     )
 
-    # Write results back (create report first so we can link it in history)
-    report_path = create_report(
+    # Write the report and the updated task file (history links the report)
+    report_path = record_execution(
         task, result, config.reports_path, parameters=task.parameters,
     )
-    update_task_state(task, result, report_path=report_path)
 
     # Show result
     if result.success:
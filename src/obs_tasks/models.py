@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import functools
 import re
+from array import array
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -18,6 +20,8 @@ class TaskStatus(str, Enum):
     RUNNING = "running"
 
 
+# Titles repeat on every parse and every report, so slugs are memoised.
+@functools.lru_cache(maxsize=256)
 def slugify(title: str) -> str:
     """Convert a task title to a filesystem-safe identifier.
 
@@ -64,6 +68,57 @@ class Task:
     file_path: Path | None = None
     heading_line: int = 0
 
+    @property
+    def backlink(self) -> str:
+        """Wiki-link target for the source file (its name without ``.md``)."""
+        return Path(self.file_path).stem if self.file_path is not None else ""
+
+
+_NO_NEXT_RUN = float("inf")
+"""Sentinel in :attr:`TaskTable.next_runs` for tasks without a next run."""
+
+
+@dataclass
+class TaskTable:
+    """Column-oriented view of a task list, for scanning one field.
+
+    Each column holds one entry per task, in the order of the source
+    list.  ``next_runs`` stores POSIX timestamps (``inf`` when unset) in
+    a compact ``array`` so due-time scans run over plain doubles.
+    """
+
+    titles: list[str]
+    statuses: list[TaskStatus]
+    next_runs: array
+    total_runs: array
+
+    @classmethod
+    def from_tasks(cls, tasks: list[Task]) -> TaskTable:
+        return cls(
+            titles=[t.title for t in tasks],
+            statuses=[t.status for t in tasks],
+            next_runs=array(
+                "d",
+                (
+                    t.next_run.timestamp() if t.next_run else _NO_NEXT_RUN
+                    for t in tasks
+                ),
+            ),
+            total_runs=array("q", (t.total_runs for t in tasks)),
+        )
+
+    def __len__(self) -> int:
+        return len(self.titles)
+
+    def next_due(self) -> int | None:
+        """Index of the task with the earliest next run, or None."""
+        if not self.next_runs:
+            return None
+        earliest = min(self.next_runs)
+        if earliest == _NO_NEXT_RUN:
+            return None
+        return self.next_runs.index(earliest)
+
 
 @dataclass
 class ExecutionResult:
@@ -8,8 +8,10 @@ anywhere in the file.
 
 from __future__ import annotations
 
+import functools
 import logging
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
@@ -33,12 +35,19 @@ SUCCESSFUL_RE = re.compile(r"^-\s*Successful:\s*(.+?)\s*$")
 FAILED_RE = re.compile(r"^-\s*Failed:\s*(.+?)\s*$")
 LAST_FAILURE_RE = re.compile(r"^-\s*Last Failure:\s*(.+?)\s*$")
 
-# Heading pattern for section detection
-_HEADING_RE = re.compile(r"^(#{1,6})\s+(.+)$")
-
 # Generic parameter line: "- Key: Value"
 _PARAM_LINE_RE = re.compile(r"^-\s+(.+?):\s+(.+?)\s*$")
 
+# Upper bound on concurrent file reads in parse_all_tasks
+_MAX_READ_WORKERS = 16
+
+# Placeholder values meaning "no number yet" (compared lowercased);
+# shared by _parse_int and _parse_duration
+_NUMERIC_PLACEHOLDERS = frozenset({"", "-", "n/a"})
+
+# Thousands separators stripped before int() ("1,247" -> "1247")
+_INT_STRIP = str.maketrans("", "", ",")
+
 
 def find_task_files(vault_path: Path, task_folder: str = "Tasks") -> list[Path]:
     """Find all .md files in the task folder, recursively.
@@ -68,13 +77,17 @@ def parse_file(file_path: Path) -> list[Task]:
     Returns a list with one Task, or empty list if no valid task found.
     """
     try:
-        content = file_path.read_text(encoding="utf-8")
+        st = file_path.stat()
+        scanned = _scan_file(
+            str(file_path), st.st_ino, st.st_mtime_ns, st.st_size
+        )
     except OSError as e:
         logger.warning("Cannot read file %s: %s", file_path, e)
         return []
 
-    lines = content.splitlines()
-    fields = _extract_fields(lines)
+    if scanned is None:
+        return []
+    fields, parameters = scanned
 
     if not fields.get("command") or not fields.get("schedule"):
         if fields.get("command") and not fields.get("schedule"):
@@ -85,8 +98,6 @@ def parse_file(file_path: Path) -> list[Task]:
 
     title = file_path.stem  # filename without .md
 
-    parameters = _parse_parameters_section(lines)
-
     task = Task(
         id=slugify(title),
         title=title,
@@ -105,22 +116,80 @@ def parse_file(file_path: Path) -> list[Task]:
         successful_runs=_parse_int(fields.get("successful")),
         failed_runs=_parse_int(fields.get("failed")),
         last_failure=_parse_datetime(fields.get("last_failure")),
-        parameters=parameters,
+        parameters=dict(parameters) if parameters else None,
         file_path=file_path,
         heading_line=0,
     )
     return [task]
 
 
+@functools.lru_cache(maxsize=4096)
+def _scan_file(
+    path: str, inode: int, mtime_ns: int, size: int
+) -> tuple[dict[str, str], dict[str, str] | None] | None:
+    """Read a file and extract its raw field and parameter strings.
+
+    Cached on the file's inode, mtime and size, so a long-lived process
+    re-reading an unchanged file skips the read and line scan, while an
+    atomic replace or an edit that changes mtime/size misses the cache.
+    On filesystems with coarse mtimes (e.g. 2 s on FAT, 1 s on older
+    HFS+), an in-place edit that keeps the size and lands within the same
+    mtime tick is not detected, and the stale result is served until the
+    file changes again.  Returns None for files without a ``Command:`` line.  Callers must
+    not mutate the returned dicts.
+    """
+    raw = Path(path).read_bytes()
+
+    # Cheap byte scan first: without a Command line there is no task, so
+    # ordinary notes living next to task files skip the line-by-line parse.
+    if b"Command:" not in raw:
+        return None
+
+    lines = raw.decode("utf-8").splitlines()
+    return _extract_fields(lines), _parse_parameters_section(lines)
+
+
 def parse_all_tasks(vault_path: Path, task_folder: str = "Tasks") -> list[Task]:
-    """Find all task files and parse all tasks from them."""
+    """Find all task files and parse all tasks from them.
+
+    Files are read on a small thread pool so that slow reads (synced or
+    network-backed vaults) overlap; results keep the sorted file order.
+    """
     files = find_task_files(vault_path, task_folder)
+    if len(files) <= 1:
+        return [task for f in files for task in parse_file(f)]
+
     tasks = []
-    for f in files:
-        tasks.extend(parse_file(f))
+    workers = min(_MAX_READ_WORKERS, len(files))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for file_tasks in pool.map(parse_file, files):
+            tasks.extend(file_tasks)
     return tasks
 
 
+def _heading_level(line: str) -> tuple[int, str] | None:
+    r"""Return ``(level, title)`` for a Markdown heading line, else None.
+
+    Counts the leading ``#`` characters directly instead of running a
+    regex on every line.  Matches the same lines as ``^#{1,6}\s+.+$``,
+    including a blank-titled ``"####  "`` (hashes, then two or more
+    whitespace characters), which is returned with an empty title.
+
+    >>> _heading_level("#### Parameters")
+    (4, 'Parameters')
+    >>> _heading_level("- Key: value") is None
+    True
+    """
+    stripped = line.lstrip("#")
+    level = len(line) - len(stripped)
+    if not 1 <= level <= 6 or not stripped[:1].isspace():
+        return None
+    title = stripped.strip()
+    if not title and len(stripped) < 2:
+        return None
+    return level, title
+
+
 def _normalize_param_key(key: str) -> str:
     """Normalize a parameter key: lowercase, spaces → underscores.
 
@@ -142,10 +211,9 @@ def _parse_parameters_section(lines: list[str]) -> dict[str, str] | None:
     section_start = None
     section_level = None
     for i, line in enumerate(lines):
-        m = _HEADING_RE.match(line)
-        if m:
-            level = len(m.group(1))
-            title = m.group(2).strip()
+        heading = _heading_level(line)
+        if heading:
+            level, title = heading
             if title.lower() == "parameters" and section_start is None:
                 section_start = i
                 section_level = level
@@ -161,8 +229,8 @@ def _parse_parameters_section(lines: list[str]) -> dict[str, str] | None:
     for i in range(section_start + 1, len(lines)):
         line = lines[i]
         # Stop at next heading of same or higher level
-        hm = _HEADING_RE.match(line)
-        if hm and len(hm.group(1)) <= section_level:
+        heading = _heading_level(line)
+        if heading and heading[0] <= section_level:
             break
         # Stop at horizontal rule
         if line.strip() == "---":
@@ -302,11 +370,12 @@ def _parse_duration(value: str | None) -> float | None:
         return None
 
     cleaned = value.strip()
-    if cleaned in ("-", "", "N/A"):
+    if cleaned.lower() in _NUMERIC_PLACEHOLDERS:
         return None
 
-    # Remove trailing 's' suffix
-    cleaned = cleaned.rstrip("s").strip()
+    # Remove trailing 's' suffix; float() tolerates surrounding spaces
+    if cleaned.endswith("s"):
+        cleaned = cleaned[:-1]
 
     try:
         return float(cleaned)
@@ -321,14 +390,12 @@ def _parse_int(value: str | None) -> int:
         return 0
 
     cleaned = value.strip()
-    if cleaned in ("-", "", "N/A"):
+    if cleaned.lower() in _NUMERIC_PLACEHOLDERS:
         return 0
 
-    # Handle comma-separated numbers like "1,247"
-    cleaned = cleaned.replace(",", "")
-
     try:
-        return int(cleaned)
+        # Handle comma-separated numbers like "1,247"
+        return int(cleaned.translate(_INT_STRIP))
     except ValueError:
         logger.warning("Cannot parse integer: '%s'", value)
         return 0
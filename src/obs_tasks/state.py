@@ -19,24 +19,26 @@ logger = logging.getLogger(__name__)
 STATE_FILENAME = "Task Runner.md"
 
 
+# Static parts of the state file, split around the two timestamps.
+_CONTENT_PREFIX = "---\nlast_startup: '"
+_CONTENT_MIDDLE = "'\n---\n\n# Task Runner State\n\n**Last Startup:** "
+_CONTENT_SUFFIX = (
+    "\n"
+    "\n"
+    "⚠️ This file is managed automatically. Manual edits may be overwritten.\n"
+)
+
+
 def _build_content(last_startup: datetime) -> str:
-    """Build the full .task-runner.md content."""
-    frontmatter = yaml.dump(
-        {"last_startup": last_startup.isoformat()},
-        default_flow_style=False,
-    ).strip()
-
-    return (
-        f"---\n"
-        f"{frontmatter}\n"
-        f"---\n"
-        f"\n"
-        f"# Task Runner State\n"
-        f"\n"
-        f"**Last Startup:** {last_startup.strftime('%Y-%m-%d %H:%M:%S')}\n"
-        f"\n"
-        f"⚠️ This file is managed automatically. Manual edits may be overwritten.\n"
-    )
+    """Build the full .task-runner.md content.
+
+    The frontmatter value is the quoted ISO timestamp (the same output
+    ``yaml.dump`` produces for it); the human-readable line reuses the
+    date and time parts of that single render.
+    """
+    iso = last_startup.isoformat()
+    human = f"{iso[:10]} {iso[11:19]}"
+    return _CONTENT_PREFIX + iso + _CONTENT_MIDDLE + human + _CONTENT_SUFFIX
 
 
 def load_last_startup(vault_path: Path) -> datetime | None:
@@ -10,10 +10,14 @@ Design rules:
 
 from __future__ import annotations
 
+import errno
 import logging
 import os
 import re
 import tempfile
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
 from datetime import datetime
 from pathlib import Path
 
@@ -38,9 +42,12 @@ def _format_status(status: TaskStatus) -> str:
 
 
 def _format_datetime(dt: datetime | None) -> str:
+    """Format as ``YYYY-MM-DD HH:MM:SS`` (wall-clock time, no offset)."""
     if dt is None:
         return "-"
-    return dt.strftime("%Y-%m-%d %H:%M:%S")
+    if dt.tzinfo is not None:
+        dt = dt.replace(tzinfo=None)
+    return dt.isoformat(sep=" ", timespec="seconds")
 
 
 def _format_duration(seconds: float | None) -> str:
@@ -67,16 +74,16 @@ def build_current_state_lines(
     next_run: datetime | None,
     duration: float | None,
     result_summary: str | None,
-) -> list[str]:
+) -> tuple[str, ...]:
     """Build the lines for a ``#### Current State`` section."""
-    return [
+    return (
         "#### Current State",
         f"- Status: {_format_status(status)}",
         f"- Last Run: {_format_datetime(last_run)}",
         f"- Next Run: {_format_datetime(next_run)}",
         f"- Duration: {_format_duration(duration)}",
         f"- Result: {_format_result(result_summary)}",
-    ]
+    )
 
 
 def build_statistics_lines(
@@ -84,15 +91,15 @@ def build_statistics_lines(
     successful_runs: int,
     failed_runs: int,
     last_failure: datetime | None,
-) -> list[str]:
+) -> tuple[str, ...]:
     """Build the lines for a ``#### Statistics`` section."""
-    return [
+    return (
         "#### Statistics",
         f"- Total Runs: {total_runs}",
         f"- Successful: {successful_runs}",
         f"- Failed: {failed_runs}",
         f"- Last Failure: {_format_datetime(last_failure)}",
-    ]
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -108,6 +115,18 @@ _HISTORY_HEADER = [
     "|------|--------|----------|--------|",
 ]
 
+# Template for a new data row, bound once at import time.
+_HISTORY_ROW = "| {time} | {status} | {duration:.1f}s | {report} |".format_map
+
+_HISTORY_STATUS = {True: "✅", False: "❌"}
+
+# A data row of the history table, captured without surrounding
+# whitespace.  Header ("| Time") and separator ("|---") rows are excluded;
+# headings and blank lines never start with "|".
+_HISTORY_ROW_RE = re.compile(
+    r"^[^\S\n]*(\|(?!---| Time)[^\n]*?)[^\S\n]*$", re.MULTILINE
+)
+
 
 def _parse_history_rows(
     lines: list[str],
@@ -119,17 +138,7 @@ def _parse_history_rows(
     row and separator row).
     """
     start, end = section_range
-    rows: list[str] = []
-    for i in range(start, end):
-        line = lines[i].strip()
-        # Skip heading, header row, separator row, and blanks
-        if not line or line.startswith("#") or line.startswith("|---"):
-            continue
-        if line.startswith("| Time"):
-            continue
-        if line.startswith("|"):
-            rows.append(line)
-    return rows
+    return _HISTORY_ROW_RE.findall("\n".join(lines[start:end]))
 
 
 def build_run_history_lines(
@@ -142,31 +151,69 @@ def build_run_history_lines(
     Prepends a new row for *result*, keeps at most
     :data:`MAX_HISTORY_ROWS` rows.
     """
-    status_emoji = "✅" if result.success else "❌"
-    time_str = result.started_at.strftime("%Y-%m-%d %H:%M:%S")
-    duration_str = _format_duration(result.duration)
-
     if report_name:
         # Obsidian wiki-link without .md extension
         report_link = f"[[{report_name}]]"
     else:
         report_link = "-"
 
-    new_row = f"| {time_str} | {status_emoji} | {duration_str} | {report_link} |"
+    new_row = _HISTORY_ROW(
+        {
+            "time": _format_datetime(result.started_at),
+            "status": _HISTORY_STATUS[result.success],
+            "duration": result.duration,
+            "report": report_link,
+        }
+    )
+
+    # Only the rows that survive truncation are copied, however many
+    # existing rows were passed in.
+    return [*_HISTORY_HEADER, new_row, *existing_rows[: MAX_HISTORY_ROWS - 1]]
 
-    all_rows = [new_row] + existing_rows
-    # Truncate to max rows
-    all_rows = all_rows[:MAX_HISTORY_ROWS]
 
-    return _HISTORY_HEADER + all_rows
+def build_task_sections(
+    task: Task,
+    result: ExecutionResult,
+    existing_rows: list[str],
+    report_name: str | None = None,
+) -> Iterator[tuple[str, Sequence[str]]]:
+    """Yield ``(section_title, lines)`` for every system-managed section.
+
+    *task* must already carry the new state.  Sections are yielded in
+    file order — Current State, Statistics, Run History — and built
+    lazily, one at a time.  They are separate items rather than one
+    stream because users may keep their own sections in between.
+    """
+    yield "Current State", build_current_state_lines(
+        task.status,
+        task.last_run,
+        task.next_run,
+        task.duration,
+        task.result_summary,
+    )
+    yield "Statistics", build_statistics_lines(
+        task.total_runs,
+        task.successful_runs,
+        task.failed_runs,
+        task.last_failure,
+    )
+    yield "Run History", build_run_history_lines(
+        existing_rows, result, report_name
+    )
 
 
 # ---------------------------------------------------------------------------
 # Section replacement in file content
 # ---------------------------------------------------------------------------
 
-# Matches a heading line like "#### Current State" or "#### Statistics"
-_HEADING_RE = re.compile(r"^(#{1,6})\s+(.+)$")
+# One pass over a joined block finds every line that can open or close a
+# section: a heading (any level), a ``---`` rule, or a ``**Detailed``
+# output link.  ``[^\S\n]`` is whitespace that cannot cross a line break.
+_SECTION_BOUNDARY_RE = re.compile(
+    r"^(?:(?P<hashes>#{1,6})[^\S\n]+(?P<title>[^\n]+)"
+    r"|[^\S\n]*(?:---[^\S\n]*$|\*\*Detailed))",
+    re.MULTILINE,
+)
 
 
 def _find_section_range(
@@ -182,30 +229,25 @@ def _find_section_range(
     separator, a ``**Detailed`` link line, or EOF.
     """
     end = search_end if search_end is not None else len(lines)
+    text = "\n".join(lines[search_start:end])
+    target = section_title.lower()
     start_idx = None
-    section_level = None
-
-    for i in range(search_start, end):
-        m = _HEADING_RE.match(lines[i])
-        if m:
-            level = len(m.group(1))
-            title = m.group(2).strip()
-            if title.lower() == section_title.lower() and start_idx is None:
-                start_idx = i
-                section_level = level
-                continue
-            # If we already found the section, stop at next heading
-            # at same or higher level.
-            if start_idx is not None and level <= section_level:
-                return (start_idx, i)
-
-        # Also stop at horizontal rules or detailed-output links
-        if start_idx is not None:
-            stripped = lines[i].strip()
-            if stripped == "---":
-                return (start_idx, i)
-            if stripped.startswith("**Detailed"):
-                return (start_idx, i)
+    section_level = 0
+
+    # Match offsets are mapped back to line numbers by counting the
+    # newlines skipped since the previous match.
+    line_no = search_start
+    pos = 0
+    for m in _SECTION_BOUNDARY_RE.finditer(text):
+        line_no += text.count("\n", pos, m.start())
+        pos = m.start()
+        hashes = m.group("hashes")
+        if start_idx is None:
+            if hashes and m.group("title").strip().lower() == target:
+                start_idx = line_no
+                section_level = len(hashes)
+        elif hashes is None or len(hashes) <= section_level:
+            return (start_idx, line_no)
 
     if start_idx is not None:
         return (start_idx, end)
@@ -225,7 +267,7 @@ def _find_task_block_range(
 def _replace_or_insert_section(
     lines: list[str],
     section_title: str,
-    new_section_lines: list[str],
+    new_section_lines: Sequence[str],
     block_start: int,
     block_end: int,
 ) -> list[str]:
@@ -233,6 +275,8 @@ def _replace_or_insert_section(
 
     The section is searched within ``lines[block_start:block_end]``.
     If not found, the new section is appended at the end of the block.
+    *lines* is spliced in place and returned, so only the lines that
+    actually move are copied.
     """
     section_range = _find_section_range(
         lines, section_title, search_start=block_start, search_end=block_end
@@ -240,7 +284,7 @@ def _replace_or_insert_section(
 
     if section_range is not None:
         s_start, s_end = section_range
-        return lines[:s_start] + new_section_lines + [""] + lines[s_end:]
+        lines[s_start:s_end] = [*new_section_lines, ""]
     else:
         # Insert before block_end (before the next heading / EOF).
         # Add a blank line before the section if the preceding line isn't blank.
@@ -248,13 +292,8 @@ def _replace_or_insert_section(
         prefix = []
         if insert_at > 0 and lines[insert_at - 1].strip() != "":
             prefix = [""]
-        return (
-            lines[:insert_at]
-            + prefix
-            + new_section_lines
-            + [""]
-            + lines[insert_at:]
-        )
+        lines[insert_at:insert_at] = [*prefix, *new_section_lines, ""]
+    return lines
 
 
 # ---------------------------------------------------------------------------
@@ -262,23 +301,138 @@ def _replace_or_insert_section(
 # ---------------------------------------------------------------------------
 
 
-def _atomic_write(file_path: Path, content: str) -> None:
-    """Write *content* to *file_path* atomically (temp file + rename)."""
-    file_path.parent.mkdir(parents=True, exist_ok=True)
-    fd, tmp_path = tempfile.mkstemp(
-        dir=file_path.parent, suffix=".tmp", prefix=".obs-tasks-"
-    )
+# O_TMPFILE needs /proc to give the finished inode a name (see _link_tmpfile).
+_HAS_O_TMPFILE = hasattr(os, "O_TMPFILE") and os.path.isdir("/proc/self/fd")
+
+_TMP_PREFIX = ".obs-tasks-"
+_TMP_SUFFIX = ".tmp"
+
+# Mode of every temp file (and so of every rewritten file); matches what
+# mkstemp creates.
+_TMP_MODE = 0o600
+
+# O_BINARY (Windows only) keeps os.read from translating CRLF and stopping
+# at the first \x1a, as tempfile does for its own descriptors.
+_READ_FLAGS = os.O_RDONLY | getattr(os, "O_BINARY", 0)
+
+# errno values meaning "O_TMPFILE is not available here" (old kernel or a
+# filesystem without support); anything else is a real error.
+_TMPFILE_UNSUPPORTED = frozenset({errno.EOPNOTSUPP, errno.EISDIR, errno.EINVAL})
+
+
+def _open_tmpfile(directory: Path) -> tuple[int, str | None]:
+    """Open a new temp file in *directory* for writing.
+
+    Returns ``(fd, tmp_path)``.  On Linux the file is an unnamed
+    ``O_TMPFILE`` inode and *tmp_path* is None until :func:`_link_tmpfile`
+    names it, so an interrupted write never leaves a stray temp file.
+    Elsewhere it is a regular ``mkstemp`` file.  Both are created with
+    :data:`_TMP_MODE`, so rewritten files get the same permissions on
+    every platform.
+    """
+    if _HAS_O_TMPFILE:
+        try:
+            flags = os.O_TMPFILE | os.O_WRONLY
+            return os.open(directory, flags, _TMP_MODE), None
+        except OSError as exc:
+            if exc.errno not in _TMPFILE_UNSUPPORTED:
+                raise
+    return tempfile.mkstemp(dir=directory, suffix=_TMP_SUFFIX, prefix=_TMP_PREFIX)
+
+
+def _link_tmpfile(fd: int, directory: Path) -> str:
+    """Give the unnamed ``O_TMPFILE`` inode behind *fd* a temp name."""
+    tmp_name = f"{_TMP_PREFIX}{os.urandom(6).hex()}{_TMP_SUFFIX}"
+    dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        # dst_dir_fd makes os.link use linkat(AT_SYMLINK_FOLLOW), which
+        # links the inode behind the /proc fd symlink.
+        os.link(f"/proc/self/fd/{fd}", tmp_name, dst_dir_fd=dir_fd)
+    finally:
+        os.close(dir_fd)
+    return os.path.join(directory, tmp_name)
+
+
+# Payloads at least this large are preallocated before writing, so the
+# filesystem can reserve one extent instead of growing the file as it goes.
+# Below it the extra syscall costs more than it saves.
+_PREALLOCATE_MIN = 1 << 20
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    """Write *data* to *fd*, normally in a single ``os.write``."""
+    if len(data) >= _PREALLOCATE_MIN and hasattr(os, "posix_fallocate"):
+        try:
+            os.posix_fallocate(fd, 0, len(data))
+        except OSError:
+            pass  # Best effort only; the write below is what matters.
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+def _read_bytes(file_path: Path) -> bytes:
+    """Read a whole file through one raw descriptor.
+
+    The size from ``fstat`` lets the common case finish in a single
+    ``os.read``, without the buffered-IO layer ``Path.read_bytes`` adds.
+    Memory-mapping would not save a copy: the caller decodes the bytes
+    and also keeps them to compare against the rewritten content, and
+    slicing an mmap into ``bytes`` costs the same copy as this read.
+    """
+    fd = os.open(file_path, _READ_FLAGS)
     try:
-        with os.fdopen(fd, "w", encoding="utf-8") as f:
-            f.write(content)
+        size = os.fstat(fd).st_size
+        # Asking for one byte more than expected shows whether EOF was hit.
+        data = os.read(fd, size + 1)
+        if len(data) == size:
+            return data
+        # Short read, or the file changed size since fstat: read to EOF.
+        chunks = [data]
+        while chunk := os.read(fd, 65536):
+            chunks.append(chunk)
+        return b"".join(chunks)
+    finally:
+        os.close(fd)
+
+
+def _atomic_write(
+    file_path: Path,
+    content: str | bytes,
+    durable: bool = True,
+) -> None:
+    """Write *content* to *file_path* atomically (temp file + rename).
+
+    *content* may be text (encoded as UTF-8) or already-encoded bytes.
+    It is written straight to the descriptor, then fsync'ed before the
+    rename so a crash mid-write never leaves a truncated file behind.
+    Pass ``durable=False`` for files that are cheap to lose: the fsync
+    is skipped, so readers still never see a partial file, but the new
+    content may be lost (or empty) after a power failure.  On failure
+    the temp file is removed.
+    """
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    directory = file_path.parent
+    directory.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = _open_tmpfile(directory)
+    try:
+        _write_all(fd, content)
+        if durable:
+            os.fsync(fd)
+        if tmp_path is None:
+            tmp_path = _link_tmpfile(fd, directory)
         os.replace(tmp_path, file_path)
     except Exception:
         # Clean up temp file on failure
-        try:
-            os.unlink(tmp_path)
-        except OSError:
-            pass
+        if tmp_path is not None:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
         raise
+    finally:
+        os.close(fd)
 
 
 # ---------------------------------------------------------------------------
@@ -286,73 +440,45 @@ def _atomic_write(file_path: Path, content: str) -> None:
 # ---------------------------------------------------------------------------
 
 
-def update_task_state(
+def _apply_result(
     task: Task,
     result: ExecutionResult,
-    next_run: datetime | None = None,
-    report_path: Path | None = None,
-) -> None:
-    """Update the ``#### Current State`` section in the task's source file.
-
-    Also updates ``#### Statistics`` and ``#### Run History`` in the same
-    write.  Pass *report_path* to include an Obsidian wiki-link in the
-    history table.
-    """
-    if task.file_path is None:
-        logger.error("Cannot update task '%s': no file_path", task.title)
-        return
-
-    file_path = Path(task.file_path)
-    if not file_path.exists():
-        logger.error("Task file does not exist: %s", file_path)
-        return
-
-    content = file_path.read_text(encoding="utf-8")
-    lines = content.splitlines()
-
-    block_start, block_end = _find_task_block_range(lines, task)
-
-    # Compute new state values
-    status = TaskStatus.SUCCESS if result.success else TaskStatus.FAILED
-    last_run = result.started_at
-    duration = result.duration
-    summary = result.summary
-
-    # Compute new statistics
-    total_runs = task.total_runs + 1
-    successful_runs = task.successful_runs + (1 if result.success else 0)
-    failed_runs = task.failed_runs + (0 if result.success else 1)
-    last_failure = (
-        result.started_at if not result.success else task.last_failure
-    )
-
-    # Build new section lines
-    state_lines = build_current_state_lines(
-        status, last_run, next_run, duration, summary
-    )
-    stats_lines = build_statistics_lines(
-        total_runs, successful_runs, failed_runs, last_failure
+    next_run: datetime | None,
+) -> Task:
+    """Return a copy of *task* with state and statistics advanced by *result*."""
+    return replace(
+        task,
+        status=TaskStatus.SUCCESS if result.success else TaskStatus.FAILED,
+        last_run=result.started_at,
+        next_run=next_run,
+        duration=result.duration,
+        result_summary=result.summary or None,
+        total_runs=task.total_runs + 1,
+        successful_runs=task.successful_runs + (1 if result.success else 0),
+        failed_runs=task.failed_runs + (0 if result.success else 1),
+        last_failure=(
+            result.started_at if not result.success else task.last_failure
+        ),
     )
 
-    # Replace/insert Current State first, then Statistics.
-    # After replacing Current State, block_end may shift, so we
-    # re-find the block range for Statistics.
-    lines = _replace_or_insert_section(
-        lines, "Current State", state_lines, block_start, block_end
-    )
 
-    # Re-find block range (it may have shifted after insertion)
-    block_start, block_end = _find_task_block_range(lines, task)
-
-    lines = _replace_or_insert_section(
-        lines, "Statistics", stats_lines, block_start, block_end
-    )
+def _apply_sections(
+    lines: list[str],
+    task: Task,
+    result: ExecutionResult,
+    report_path: Path | None,
+) -> list[str]:
+    """Write the managed sections for one update into *lines*.
 
-    # --- Run History ---
-    # Re-find block range again (may have shifted after Statistics)
+    *task* must already carry the new state (see :func:`_apply_result`);
+    *result* provides the new Run History row.
+    """
     block_start, block_end = _find_task_block_range(lines, task)
 
-    # Read existing history rows (if any)
+    # Read existing history rows (if any) before any section moves.  In a
+    # malformed file where another managed section's range overlaps the
+    # history rows, this keeps those rows rather than dropping them along
+    # with the replaced section.
     history_range = _find_section_range(
         lines, "Run History", search_start=block_start, search_end=block_end
     )
@@ -363,105 +489,275 @@ def update_task_state(
     # Build report name for wiki-link (stem without .md)
     report_name = report_path.stem if report_path else None
 
-    history_lines = build_run_history_lines(
-        existing_rows, result, report_name
-    )
+    # Replace/insert Current State, Statistics and Run History in turn.
+    # Each replacement may shift the block end, so the block range is
+    # re-found before every section.
+    for title, section_lines in build_task_sections(
+        task, result, existing_rows, report_name
+    ):
+        block_start, block_end = _find_task_block_range(lines, task)
+        lines = _replace_or_insert_section(
+            lines, title, section_lines, block_start, block_end
+        )
+    return lines
 
-    lines = _replace_or_insert_section(
-        lines, "Run History", history_lines, block_start, block_end
-    )
 
-    new_content = "\n".join(lines)
+def _join_lines(lines: list[str]) -> str:
+    """Join *lines* into file content ending with exactly one newline."""
+    content = "\n".join(lines)
     # Ensure file ends with newline
-    if not new_content.endswith("\n"):
-        new_content += "\n"
+    if not content.endswith("\n"):
+        content += "\n"
+    return content
+
 
-    _atomic_write(file_path, new_content)
-    logger.info("Updated state for task '%s' in %s", task.title, file_path)
+def update_task_state_text(
+    text: str,
+    task: Task,
+    result: ExecutionResult,
+    next_run: datetime | None = None,
+    report_path: Path | None = None,
+) -> str:
+    """Return *text* (a task file's content) with *result* applied.
 
+    The in-memory core of :func:`update_task_state`: the same section
+    updates, without reading or writing any file.
+    """
+    updated = _apply_result(task, result, next_run)
+    lines = _apply_sections(text.splitlines(), updated, result, report_path)
+    return _join_lines(lines)
+
+
+def _update_task_files(
+    updates: list[tuple[Task, ExecutionResult, datetime | None, Path | None]],
+) -> list[Task | None]:
+    """Apply ``(task, result, next_run, report_path)`` updates, one write per file.
+
+    Updates are grouped by task file; each file is read once, has its
+    updates applied in the given order, and is rewritten once — or not
+    at all if its content would not change.  With one task per file,
+    updates sharing a file are runs of the same task, so each one builds
+    on the task returned by the previous one rather than on its own
+    (by then stale) *task*.  Returns the updated task copies aligned
+    with *updates*, None where the file could not be updated.
+    """
+    updated: list[Task | None] = [None] * len(updates)
+    by_file: dict[Path, list[int]] = {}
+    for i, (task, _, _, _) in enumerate(updates):
+        if task.file_path is None:
+            logger.error("Cannot update task '%s': no file_path", task.title)
+            continue
+        by_file.setdefault(Path(task.file_path), []).append(i)
+
+    if len(by_file) > 1:
+        # Relative and absolute spellings of one file must share a group,
+        # or the second write would clobber the first.  Resolving costs a
+        # stat per path component, so it is skipped for a single path.
+        merged: dict[Path, tuple[Path, list[int]]] = {}
+        for file_path, indices in by_file.items():
+            merged.setdefault(file_path.resolve(), (file_path, []))[1].extend(
+                indices
+            )
+        groups = [(path, sorted(indices)) for path, indices in merged.values()]
+    else:
+        groups = list(by_file.items())
 
-def create_report(
+    for file_path, indices in groups:
+        # Read directly rather than stat first: a missing file surfaces as
+        # FileNotFoundError without a separate exists() check.
+        try:
+            raw = _read_bytes(file_path)
+        except FileNotFoundError:
+            logger.error("Task file does not exist: %s", file_path)
+            continue
+
+        lines = raw.decode("utf-8").splitlines()
+        current = updates[indices[0]][0]
+        for i in indices:
+            _, result, next_run, report_path = updates[i]
+            current = updated[i] = _apply_result(current, result, next_run)
+            lines = _apply_sections(lines, current, result, report_path)
+
+        new_bytes = _join_lines(lines).encode("utf-8")
+
+        if new_bytes == raw:
+            logger.debug("Task file unchanged, not rewriting: %s", file_path)
+            continue
+        _atomic_write(file_path, new_bytes)
+        for i in indices:
+            logger.info(
+                "Updated state for task '%s' in %s", updates[i][0].title, file_path
+            )
+
+    return updated
+
+
+def update_task_state(
+    task: Task,
+    result: ExecutionResult,
+    next_run: datetime | None = None,
+    report_path: Path | None = None,
+) -> Task | None:
+    """Update the ``#### Current State`` section in the task's source file.
+
+    Also updates ``#### Statistics`` and ``#### Run History`` in the same
+    write.  Pass *report_path* to include an Obsidian wiki-link in the
+    history table.
+
+    Returns a copy of *task* carrying the values just written, so callers
+    running the task again need not re-parse the file; returns None if
+    the file could not be updated.
+    """
+    return _update_task_files([(task, result, next_run, report_path)])[0]
+
+
+def update_task_states(
+    updates: list[tuple[Task, ExecutionResult, datetime | None]],
+) -> list[Task | None]:
+    """Apply several ``(task, result, next_run)`` updates in one pass.
+
+    Like calling :func:`update_task_state` for each entry in order, but
+    every task file is read and rewritten at most once, however many of
+    the updates target it.  Returns the updated task copies aligned with
+    *updates* (None where a file could not be updated).
+    """
+    return _update_task_files(
+        [(task, result, next_run, None) for task, result, next_run in updates]
+    )
+
+
+# Static parts of a report.  The header is a bound ``str.format`` so the
+# template string is built once at import time.
+_REPORT_HEADER = (
+    "# {title} - Execution Report\n"
+    "\n"
+    "**Executed:** {executed}\n"
+    "**Duration:** {duration:.1f} seconds\n"
+    "**Command:** `{command}`\n"
+    "**Exit Code:** {exit_code}\n"
+    "**Status:** {status}\n"
+).format
+
+_REPORT_PARAMETERS_HEADER = (
+    "\n"
+    "## Parameters\n"
+    "\n"
+    "| Parameter | Value |\n"
+    "|-----------|-------|\n"
+)
+
+_REPORT_FOOTER = "\n---\n*Generated by Obsidian Task Automation*\n"
+
+
+def _build_report(
     task: Task,
     result: ExecutionResult,
     reports_dir: Path,
-    parameters: dict[str, str] | None = None,
-) -> Path:
-    """Create a detailed report file for an execution.
+    parameters: dict[str, str] | None,
+) -> tuple[Path, bytes]:
+    """Return ``(report_path, content)`` for an execution report.
 
-    Returns the path to the created report file.
+    The content is returned UTF-8 encoded, ready for the atomic writer.
     """
-    date_str = result.started_at.strftime("%Y-%m-%d-%H%M%S")
+    ts = result.started_at
+    # Plain %-formatting of the fields; strftime goes through the C
+    # library's locale-aware formatter for the same digits.
+    date_str = "%04d-%02d-%02d-%02d%02d%02d" % (
+        ts.year, ts.month, ts.day, ts.hour, ts.minute, ts.second
+    )
     slug = slugify(task.title)
     filename = f"{date_str}-{slug}.md"
     report_path = reports_dir / filename
 
     status_text = "✅ Success" if result.success else "❌ Failed"
 
-    # Build the source file backlink (Obsidian wiki-link style)
-    source_link = ""
-    if task.file_path is not None:
-        # Use relative name without .md extension for Obsidian link
-        source_name = Path(task.file_path).stem
-        source_link = f"- Back to [[{source_name}]]"
-
-    # Build report content
-    report_lines = [
-        f"# {task.title} - Execution Report",
-        "",
-        f"**Executed:** {_format_datetime(result.started_at)}",
-        f"**Duration:** {result.duration:.1f} seconds",
-        f"**Command:** `{task.command}`",
-        f"**Exit Code:** {result.exit_code}",
-        f"**Status:** {status_text}",
+    # Build report content as a list of blocks, joined once at the end
+    parts = [
+        _REPORT_HEADER(
+            title=task.title,
+            executed=_format_datetime(result.started_at),
+            duration=result.duration,
+            command=task.command,
+            exit_code=result.exit_code,
+            status=status_text,
+        )
     ]
 
     # Add parameters section if present
     if parameters:
-        report_lines += [
-            "",
-            "## Parameters",
-            "",
-            "| Parameter | Value |",
-            "|-----------|-------|",
-        ]
-        for key, value in parameters.items():
-            report_lines.append(f"| {key} | {value} |")
-
-    report_lines += [
-        "",
-        "## Output",
-        "",
-        "```",
-        result.stdout.rstrip() if result.stdout else "(no output)",
-        "```",
-    ]
+        parts.append(_REPORT_PARAMETERS_HEADER)
+        parts.extend(
+            f"| {key} | {value} |\n" for key, value in parameters.items()
+        )
+
+    output = result.stdout.rstrip() if result.stdout else "(no output)"
+    parts.append(f"\n## Output\n\n```\n{output}\n```\n")
 
     # Add stderr section if present
     if result.stderr and result.stderr.strip():
-        report_lines += [
-            "",
-            "## Errors",
-            "",
-            "```",
-            result.stderr.rstrip(),
-            "```",
-        ]
-
-    # Add links section
-    report_lines += [
-        "",
-        "## Links",
-    ]
-    if source_link:
-        report_lines.append(source_link)
+        parts.append(f"\n## Errors\n\n```\n{result.stderr.rstrip()}\n```\n")
 
-    report_lines += [
-        "",
-        "---",
-        "*Generated by Obsidian Task Automation*",
-    ]
+    # Add links section with the source file backlink (Obsidian
+    # wiki-link style, name without .md extension)
+    parts.append("\n## Links\n")
+    if task.file_path is not None:
+        parts.append(f"- Back to [[{task.backlink}]]\n")
+
+    parts.append(_REPORT_FOOTER)
+    return report_path, "".join(parts).encode("utf-8")
+
+
+def create_report(
+    task: Task,
+    result: ExecutionResult,
+    reports_dir: Path,
+    parameters: dict[str, str] | None = None,
+) -> Path:
+    """Create a detailed report file for an execution.
 
-    content = "\n".join(report_lines) + "\n"
-    _atomic_write(report_path, content)
+    Returns the path to the created report file.
+    """
+    report_path, content = _build_report(task, result, reports_dir, parameters)
+    # Reports are a log of past runs, not state the scheduler reads back,
+    # so they are not worth an fsync.
+    _atomic_write(report_path, content, durable=False)
     logger.info("Created report: %s", report_path)
     return report_path
+
+
+# Upper bound on concurrent report writes in create_reports
+_MAX_REPORT_WORKERS = 8
+
+
+def create_reports(
+    jobs: list[tuple[Task, ExecutionResult, Path]],
+) -> list[Path]:
+    """Create one report per ``(task, result, reports_dir)`` job.
+
+    Reports go to distinct files, so the writes run on a small thread
+    pool and their I/O waits overlap.  Returns the report paths in the
+    order of *jobs*.
+    """
+    if len(jobs) <= 1:
+        return [create_report(*job) for job in jobs]
+
+    workers = min(_MAX_REPORT_WORKERS, len(jobs))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(lambda job: create_report(*job), jobs))
+
+
+def record_execution(
+    task: Task,
+    result: ExecutionResult,
+    reports_dir: Path,
+    next_run: datetime | None = None,
+    parameters: dict[str, str] | None = None,
+) -> Path:
+    """Create the report and update the task file.
+
+    :func:`create_report` followed by :func:`update_task_state` with the
+    new report linked in Run History.  Returns the report path.
+    """
+    report_path = create_report(task, result, reports_dir, parameters)
+    update_task_state(task, result, next_run, report_path)
+    return report_path
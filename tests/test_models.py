@@ -11,6 +11,7 @@ from obs_tasks.models import (
     SystemState,
     Task,
     TaskStatus,
+    TaskTable,
     slugify,
 )
 
@@ -94,6 +95,26 @@ class TestTask:
         )
         assert task.parameters == {"amount": "1234.56", "customer": "Acme Corp"}
 
+    def test_backlink(self):
+        task = Task(
+            id="t", title="T", command="cmd", schedule="* * * * *",
+            file_path=Path("Tasks/work.md"),
+        )
+        assert task.backlink == "work"
+
+    def test_backlink_follows_file_path(self):
+        task = Task(
+            id="t", title="T", command="cmd", schedule="* * * * *",
+            file_path=Path("Tasks/work.md"),
+        )
+        assert task.backlink == "work"
+        task.file_path = Path("Tasks/renamed.md")
+        assert task.backlink == "renamed"
+
+    def test_backlink_without_file(self):
+        task = Task(id="t", title="T", command="cmd", schedule="* * * * *")
+        assert task.backlink == ""
+
 
 # --- ExecutionResult ---
 
@@ -144,6 +165,40 @@ class TestExecutionResult:
         assert result.summary == "Command timed out"
 
 
+# --- TaskTable ---
+
+
+class TestTaskTable:
+    def _task(self, title, next_run=None, **kwargs):
+        return Task(
+            id=slugify(title), title=title, command="echo", schedule="* * * * *",
+            next_run=next_run, **kwargs,
+        )
+
+    def test_columns_follow_task_order(self):
+        tasks = [
+            self._task("A", total_runs=3, status=TaskStatus.SUCCESS),
+            self._task("B", total_runs=1, status=TaskStatus.FAILED),
+        ]
+        table = TaskTable.from_tasks(tasks)
+        assert len(table) == 2
+        assert table.titles == ["A", "B"]
+        assert table.statuses == [TaskStatus.SUCCESS, TaskStatus.FAILED]
+        assert list(table.total_runs) == [3, 1]
+
+    def test_next_due_picks_earliest(self):
+        tasks = [
+            self._task("Later", next_run=datetime(2025, 1, 16, 2, 0, 0)),
+            self._task("Unscheduled"),
+            self._task("Sooner", next_run=datetime(2025, 1, 15, 2, 0, 0)),
+        ]
+        assert TaskTable.from_tasks(tasks).next_due() == 2
+
+    def test_next_due_none_when_unscheduled(self):
+        assert TaskTable.from_tasks([self._task("A")]).next_due() is None
+        assert TaskTable.from_tasks([]).next_due() is None
+
+
 # --- SystemState ---
 
 
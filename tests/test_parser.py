@@ -5,6 +5,7 @@ Design: one file = one task. The task title comes from the filename (without .md
 
 from __future__ import annotations
 
+import os
 from datetime import datetime
 from pathlib import Path
 
@@ -13,6 +14,7 @@ import pytest
 from obs_tasks.models import Task, TaskStatus
 from obs_tasks.parser import (
     _extract_fields,
+    _heading_level,
     _normalize_param_key,
     _parse_datetime,
     _parse_duration,
@@ -717,6 +719,34 @@ class TestNormalizeParamKey:
         assert _normalize_param_key("customer") == "customer"
 
 
+# ---------------------------------------------------------------------------
+# _heading_level
+# ---------------------------------------------------------------------------
+
+
+class TestHeadingLevel:
+    def test_levels(self) -> None:
+        assert _heading_level("# Title") == (1, "Title")
+        assert _heading_level("#### Parameters") == (4, "Parameters")
+        assert _heading_level("###### Deep") == (6, "Deep")
+
+    def test_strips_title_whitespace(self) -> None:
+        assert _heading_level("##   Spaced  ") == (2, "Spaced")
+        assert _heading_level("##\tTabbed") == (2, "Tabbed")
+
+    def test_not_a_heading(self) -> None:
+        assert _heading_level("- Key: value") is None
+        assert _heading_level("#hashtag") is None
+        assert _heading_level("####### Seven") is None
+        assert _heading_level("#### ") is None
+        assert _heading_level("") is None
+
+    def test_blank_title_heading(self) -> None:
+        # Hashes plus two or more whitespace characters still form a heading
+        assert _heading_level("####  ") == (4, "")
+        assert _heading_level("## \t") == (2, "")
+
+
 # ---------------------------------------------------------------------------
 # _parse_parameters_section
 # ---------------------------------------------------------------------------
@@ -792,6 +822,16 @@ class TestParseParametersSection:
         params = _parse_parameters_section(lines)
         assert params == {"key": "value"}
 
+    def test_stops_at_blank_titled_heading(self) -> None:
+        lines = [
+            "#### Parameters",
+            "- Key: value",
+            "####  ",
+            "- Other: ignored",
+        ]
+        params = _parse_parameters_section(lines)
+        assert params == {"key": "value"}
+
     def test_stops_at_horizontal_rule(self) -> None:
         lines = [
             "#### Parameters",
@@ -842,3 +882,61 @@ class TestParseFileWithParameters:
         tasks = parse_file(f)
         assert len(tasks) == 1
         assert tasks[0].parameters is None
+
+
+# ---------------------------------------------------------------------------
+# parse_file — scan cache
+# ---------------------------------------------------------------------------
+
+
+class TestParseFileCache:
+    def test_reparses_after_rewrite(self, vault: Path) -> None:
+        f = _write_task_file(
+            vault,
+            "Changing.md",
+            "- Command: `echo one`\n- Schedule: 0 * * * *\n",
+        )
+        assert parse_file(f)[0].command == "echo one"
+
+        f.write_text(
+            "- Command: `echo three`\n- Schedule: 0 * * * *\n",
+            encoding="utf-8",
+        )
+        assert parse_file(f)[0].command == "echo three"
+
+    def test_reparses_same_size_edit_in_place(self, vault: Path) -> None:
+        f = _write_task_file(
+            vault,
+            "SameSize.md",
+            "- Command: `echo one`\n- Schedule: 0 * * * *\n",
+        )
+        assert parse_file(f)[0].command == "echo one"
+        before = f.stat()
+
+        # Same inode and size; only the mtime tells the edit apart.
+        f.write_text(
+            "- Command: `echo two`\n- Schedule: 0 * * * *\n",
+            encoding="utf-8",
+        )
+        mtime_ns = before.st_mtime_ns + 1_000_000_000
+        os.utime(f, ns=(mtime_ns, mtime_ns))
+        assert f.stat().st_ino == before.st_ino
+        assert f.stat().st_size == before.st_size
+
+        assert parse_file(f)[0].command == "echo two"
+
+    def test_parameters_not_shared_between_calls(self, vault: Path) -> None:
+        f = _write_task_file(
+            vault,
+            "Params.md",
+            """\
+- Command: `echo {{params}}`
+- Schedule: 0 * * * *
+
+#### Parameters
+- Key: value
+""",
+        )
+        first = parse_file(f)[0]
+        first.parameters["key"] = "changed"
+        assert parse_file(f)[0].parameters == {"key": "value"}
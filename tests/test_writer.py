@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
+import os
+import stat
+from collections.abc import Callable
+from dataclasses import replace
 from datetime import datetime
 from pathlib import Path
+from typing import Any
 
 import pytest
 
-from obs_tasks.models import ExecutionResult, Task, TaskStatus
+from obs_tasks.models import ExecutionResult, Task, TaskStatus, slugify
 from obs_tasks.writer import (
     MAX_HISTORY_ROWS,
     _atomic_write,
@@ -17,10 +22,18 @@ from obs_tasks.writer import (
     build_current_state_lines,
     build_run_history_lines,
     build_statistics_lines,
+    build_task_sections,
     create_report,
+    create_reports,
+    record_execution,
     update_task_state,
+    update_task_state_text,
+    update_task_states,
 )
 
+_STARTED_AT = datetime(2025, 1, 15, 10, 30, 0)
+_FINISHED_AT = datetime(2025, 1, 15, 10, 30, 2)
+
 # Note: With one-file-per-task design, _find_task_block_range always
 # returns (0, len(lines)) — the entire file is the task block.
 
@@ -38,8 +51,6 @@ def _make_task(
     heading_line: int = 0,
     **kwargs,
 ) -> Task:
-    from obs_tasks.models import slugify
-
     return Task(
         id=slugify(title),
         title=title,
@@ -66,13 +77,40 @@ def _make_result(
         exit_code=exit_code,
         stdout=stdout,
         stderr=stderr,
-        started_at=datetime(2025, 1, 15, 10, 30, 0),
-        finished_at=datetime(2025, 1, 15, 10, 30, 2),
+        started_at=_STARTED_AT,
+        finished_at=_FINISHED_AT,
         duration=duration,
         error_message=error_message,
     )
 
 
+@pytest.fixture(scope="module")
+def base_task() -> Task:
+    """Default task shared across the module; derive variants with replace()."""
+    return _make_task()
+
+
+@pytest.fixture(scope="module")
+def base_result() -> ExecutionResult:
+    """Default successful result shared across the module."""
+    return _make_result()
+
+
+@pytest.fixture
+def report_factory(tmp_path: Path, base_task: Task) -> Callable[..., str]:
+    """Return a helper that writes a report for ``work.md`` and reads it back."""
+    task = replace(base_task, file_path=tmp_path / "work.md")
+
+    def make(
+        result: ExecutionResult,
+        parameters: dict[str, str] | None = None,
+    ) -> str:
+        path = create_report(task, result, tmp_path / "Reports", parameters=parameters)
+        return path.read_text(encoding="utf-8")
+
+    return make
+
+
 # ---------------------------------------------------------------------------
 # build_current_state_lines
 # ---------------------------------------------------------------------------
@@ -227,7 +265,7 @@ class TestFindSectionRange:
 class TestFindTaskBlockRange:
     """With one-file-per-task, the block is always the entire file."""
 
-    def test_whole_file_is_block(self) -> None:
+    def test_whole_file_is_block(self, base_task: Task) -> None:
         lines = [
             "## Backup Docs",
             "- Command: `echo backup`",
@@ -236,8 +274,7 @@ class TestFindTaskBlockRange:
             "#### Current State",
             "- Status: Never run",
         ]
-        task = _make_task(title="Backup Docs", heading_line=0)
-        r = _find_task_block_range(lines, task)
+        r = _find_task_block_range(lines, base_task)
         assert r == (0, 6)
 
     def test_empty_file(self) -> None:
@@ -246,10 +283,9 @@ class TestFindTaskBlockRange:
         r = _find_task_block_range(lines, task)
         assert r == (0, 0)
 
-    def test_single_line(self) -> None:
+    def test_single_line(self, base_task: Task) -> None:
         lines = ["- Command: `echo hi`"]
-        task = _make_task(heading_line=0)
-        r = _find_task_block_range(lines, task)
+        r = _find_task_block_range(lines, base_task)
         assert r == (0, 1)
 
 
@@ -283,17 +319,88 @@ class TestAtomicWrite:
         assert len(files) == 1
         assert files[0].name == "test.md"
 
+    def test_accepts_bytes(self, tmp_path: Path) -> None:
+        f = tmp_path / "test.md"
+        _atomic_write(f, "✅ done\n".encode("utf-8"))
+        assert f.read_text(encoding="utf-8") == "✅ done\n"
+
+    def test_named_tempfile_fallback(self, tmp_path: Path, monkeypatch) -> None:
+        """Without O_TMPFILE the mkstemp path is used, with the same result."""
+        monkeypatch.setattr("obs_tasks.writer._HAS_O_TMPFILE", False)
+        f = tmp_path / "test.md"
+        f.write_text("old\n")
+        _atomic_write(f, "new\n")
+        assert f.read_text() == "new\n"
+        assert [p.name for p in tmp_path.iterdir()] == ["test.md"]
+
+    @pytest.mark.skipif(os.name == "nt", reason="POSIX permission bits")
+    @pytest.mark.parametrize("has_o_tmpfile", [True, False])
+    def test_file_mode_same_on_both_paths(
+        self, tmp_path: Path, monkeypatch, has_o_tmpfile: bool
+    ) -> None:
+        monkeypatch.setattr(
+            "obs_tasks.writer._HAS_O_TMPFILE",
+            has_o_tmpfile and hasattr(os, "O_TMPFILE"),
+        )
+        f = tmp_path / "test.md"
+        _atomic_write(f, "content\n")
+        assert stat.S_IMODE(f.stat().st_mode) == 0o600
+
+    def test_empty_content(self, tmp_path: Path) -> None:
+        f = tmp_path / "empty.md"
+        _atomic_write(f, b"")
+        assert f.read_text() == ""
+
+    def test_large_payload_preallocated(self, tmp_path: Path, monkeypatch) -> None:
+        calls: list[tuple[int, int, int]] = []
+        monkeypatch.setattr("obs_tasks.writer._PREALLOCATE_MIN", 4)
+
+        def record(fd: int, offset: int, length: int) -> None:
+            calls.append((fd, offset, length))
+
+        monkeypatch.setattr(os, "posix_fallocate", record, raising=False)
+        f = tmp_path / "big.md"
+        _atomic_write(f, b"0123456789\n")
+        assert f.read_bytes() == b"0123456789\n"
+        assert len(calls) == 1
+        fd, offset, length = calls[0]
+        assert fd >= 0
+        assert (offset, length) == (0, 11)
+
+    def test_small_payload_not_preallocated(self, tmp_path: Path, monkeypatch) -> None:
+        calls: list[tuple[int, int, int]] = []
+        monkeypatch.setattr("obs_tasks.writer._PREALLOCATE_MIN", 64)
+
+        def record(fd: int, offset: int, length: int) -> None:
+            calls.append((fd, offset, length))
+
+        monkeypatch.setattr(os, "posix_fallocate", record, raising=False)
+        f = tmp_path / "small.md"
+        _atomic_write(f, b"0123456789\n")
+        assert f.read_bytes() == b"0123456789\n"
+        assert calls == []
+
+    def test_non_durable_skips_fsync(self, tmp_path: Path, monkeypatch) -> None:
+        synced: list[int] = []
+        monkeypatch.setattr("os.fsync", synced.append)
+        f = tmp_path / "report.md"
+        _atomic_write(f, b"report\n", durable=False)
+        assert f.read_text() == "report\n"
+        assert synced == []
+
 
 # ---------------------------------------------------------------------------
-# update_task_state — success scenario
+# update_task_state_text — success scenario
 # ---------------------------------------------------------------------------
 
 
 class TestUpdateTaskStateSuccess:
-    def test_updates_existing_sections(self, tmp_path: Path) -> None:
-        f = tmp_path / "task.md"
-        f.write_text(
-            """\
+    def test_updates_existing_sections(
+        self,
+        base_task: Task,
+        base_result: ExecutionResult,
+    ) -> None:
+        text = """\
 #### Task Definition
 - Command: `echo backup`
 - Schedule: 0 2 * * *
@@ -310,15 +417,8 @@ class TestUpdateTaskStateSuccess:
 - Successful: 0
 - Failed: 0
 - Last Failure: -
-""",
-            encoding="utf-8",
-        )
-
-        task = _make_task(file_path=f, heading_line=0)
-        result = _make_result()
-        update_task_state(task, result)
-
-        content = f.read_text(encoding="utf-8")
+"""
+        content = update_task_state_text(text, base_task, base_result)
         assert "✅ Success" in content
         assert "2025-01-15 10:30:00" in content
         assert "2.5s" in content
@@ -327,58 +427,63 @@ class TestUpdateTaskStateSuccess:
         assert "Successful: 1" in content
         assert "Failed: 0" in content
 
-    def test_preserves_command_and_schedule(self, tmp_path: Path) -> None:
-        f = tmp_path / "task.md"
-        f.write_text(
-            """\
+    def test_preserves_command_and_schedule(
+        self,
+        base_task: Task,
+        base_result: ExecutionResult,
+    ) -> None:
+        text = """\
 #### Task Definition
 - Command: `echo backup`
 - Schedule: 0 2 * * *
 
 #### Current State
 - Status: Never run
-""",
-            encoding="utf-8",
-        )
-        task = _make_task(file_path=f, heading_line=0)
-        result = _make_result()
-        update_task_state(task, result)
-
-        content = f.read_text(encoding="utf-8")
+"""
+        content = update_task_state_text(text, base_task, base_result)
         assert "- Command: `echo backup`" in content
         assert "- Schedule: 0 2 * * *" in content
 
-    def test_creates_sections_when_missing(self, tmp_path: Path) -> None:
-        f = tmp_path / "task.md"
-        f.write_text(
-            """\
+    def test_creates_sections_when_missing(
+        self,
+        base_task: Task,
+        base_result: ExecutionResult,
+    ) -> None:
+        text = """\
 #### Task Definition
 - Command: `echo backup`
 - Schedule: 0 2 * * *
-""",
-            encoding="utf-8",
-        )
-        task = _make_task(file_path=f, heading_line=0)
-        result = _make_result()
-        update_task_state(task, result)
-
-        content = f.read_text(encoding="utf-8")
+"""
+        content = update_task_state_text(text, base_task, base_result)
         assert "#### Current State" in content
         assert "#### Statistics" in content
         assert "✅ Success" in content
         assert "Total Runs: 1" in content
 
+    def test_file_update_matches_text_core(
+        self,
+        tmp_path: Path,
+        base_task: Task,
+        base_result: ExecutionResult,
+    ) -> None:
+        text = "#### Task Definition\n- Command: `echo backup`\n"
+        f = tmp_path / "task.md"
+        f.write_text(text, encoding="utf-8")
+
+        update_task_state(replace(base_task, file_path=f), base_result)
+
+        expected = update_task_state_text(text, base_task, base_result)
+        assert f.read_text(encoding="utf-8") == expected
+
 
 # ---------------------------------------------------------------------------
-# update_task_state — failure scenario
+# update_task_state_text — failure scenario
 # ---------------------------------------------------------------------------
 
 
 class TestUpdateTaskStateFailure:
-    def test_failure_updates_state(self, tmp_path: Path) -> None:
-        f = tmp_path / "task.md"
-        f.write_text(
-            """\
+    def test_failure_updates_state(self) -> None:
+        text = """\
 #### Task Definition
 - Command: `echo backup`
 - Schedule: 0 2 * * *
@@ -395,12 +500,8 @@ class TestUpdateTaskStateFailure:
 - Successful: 5
 - Failed: 0
 - Last Failure: -
-""",
-            encoding="utf-8",
-        )
+"""
         task = _make_task(
-            file_path=f,
-            heading_line=0,
             total_runs=5,
             successful_runs=5,
             failed_runs=0,
@@ -412,19 +513,18 @@ class TestUpdateTaskStateFailure:
             stderr="Connection refused",
             error_message="Connection refused",
         )
-        update_task_state(task, result)
-
-        content = f.read_text(encoding="utf-8")
+        content = update_task_state_text(text, task, result)
         assert "❌ Failed" in content
         assert "Total Runs: 6" in content
         assert "Successful: 5" in content
         assert "Failed: 1" in content
         assert "Last Failure: 2025-01-15" in content
 
-    def test_increments_statistics(self, tmp_path: Path) -> None:
-        f = tmp_path / "task.md"
-        f.write_text(
-            """\
+    def test_increments_statistics(
+        self,
+        base_result: ExecutionResult,
+    ) -> None:
+        text = """\
 #### Task Definition
 - Command: `echo backup`
 - Schedule: 0 2 * * *
@@ -434,21 +534,14 @@ class TestUpdateTaskStateFailure:
 - Successful: 8
 - Failed: 2
 - Last Failure: 2024-12-01 00:00:00
-""",
-            encoding="utf-8",
-        )
+"""
         task = _make_task(
-            file_path=f,
-            heading_line=0,
             total_runs=10,
             successful_runs=8,
             failed_runs=2,
             last_failure=datetime(2024, 12, 1),
         )
-        result = _make_result(success=True)
-        update_task_state(task, result)
-
-        content = f.read_text(encoding="utf-8")
+        content = update_task_state_text(text, task, base_result)
         assert "Total Runs: 11" in content
         assert "Successful: 9" in content
         assert "Failed: 2" in content
@@ -462,7 +555,12 @@ class TestUpdateTaskStateFailure:
 class TestUpdatePreservesUserContent:
     """With one-file-per-task, updates should not clobber user content."""
 
-    def test_preserves_notes_and_purpose(self, tmp_path: Path) -> None:
+    def test_preserves_notes_and_purpose(
+        self,
+        tmp_path: Path,
+        base_task: Task,
+        base_result: ExecutionResult,
+    ) -> None:
         f = tmp_path / "task.md"
         f.write_text(
             """\
@@ -483,9 +581,8 @@ class TestUpdatePreservesUserContent:
 """,
             encoding="utf-8",
         )
-        task = _make_task(file_path=f, heading_line=0)
-        result = _make_result()
-        update_task_state(task, result)
+        task = replace(base_task, file_path=f)
+        update_task_state(task, base_result)
 
         content = f.read_text(encoding="utf-8")
         # User content preserved
@@ -498,25 +595,99 @@ class TestUpdatePreservesUserContent:
         assert "✅ Success" in content
 
 
+# ---------------------------------------------------------------------------
+# update_task_state — return value
+# ---------------------------------------------------------------------------
+
+
+class TestUpdateTaskStateReturnValue:
+    def test_returns_task_with_new_state(self, tmp_path: Path) -> None:
+        f = tmp_path / "task.md"
+        f.write_text("- Command: `echo backup`\n- Schedule: 0 2 * * *\n")
+        task = _make_task(file_path=f, total_runs=3, successful_runs=3)
+        result = _make_result(success=False, exit_code=1, error_message="boom")
+        next_run = datetime(2025, 1, 16, 2, 0, 0)
+
+        updated = update_task_state(task, result, next_run=next_run)
+
+        assert updated is not task
+        assert updated.status == TaskStatus.FAILED
+        assert updated.last_run == result.started_at
+        assert updated.next_run == next_run
+        assert updated.result_summary == "boom"
+        assert updated.total_runs == 4
+        assert updated.successful_runs == 3
+        assert updated.failed_runs == 1
+        assert updated.last_failure == result.started_at
+        # The original task is left untouched
+        assert task.total_runs == 3
+
+    def test_unchanged_content_is_not_rewritten(
+        self,
+        tmp_path: Path,
+        base_task: Task,
+        base_result: ExecutionResult,
+    ) -> None:
+        """An update that reproduces the file byte-for-byte skips the write."""
+        row = "| 2025-01-15 10:30:00 | ✅ | 2.5s | - |"
+        f = tmp_path / "task.md"
+        f.write_text(
+            "- Command: `echo backup`\n- Schedule: 0 2 * * *\n\n"
+            "#### Run History\n"
+            "| Time | Status | Duration | Report |\n"
+            "|------|--------|----------|--------|\n"
+            + "\n".join([row] * MAX_HISTORY_ROWS) + "\n",
+            encoding="utf-8",
+        )
+        task = replace(base_task, file_path=f)
+        # First call adds state and statistics; the history stays identical.
+        update_task_state(task, base_result)
+        before = f.stat()
+        # Retrying the same update produces the same bytes.
+        update_task_state(task, base_result)
+        after = f.stat()
+        assert (after.st_ino, after.st_mtime_ns) == (before.st_ino, before.st_mtime_ns)
+
+    def test_returns_none_without_file(
+        self,
+        base_task: Task,
+        base_result: ExecutionResult,
+    ) -> None:
+        task = replace(base_task, file_path=None)
+        assert update_task_state(task, base_result) is None
+
+
 # ---------------------------------------------------------------------------
 # update_task_state — edge cases
 # ---------------------------------------------------------------------------
 
 
 class TestUpdateTaskStateEdgeCases:
-    def test_missing_file_path(self) -> None:
-        task = _make_task(file_path=None)
-        result = _make_result()
+    def test_missing_file_path(
+        self,
+        base_task: Task,
+        base_result: ExecutionResult,
+    ) -> None:
+        task = replace(base_task, file_path=None)
         # Should not raise
-        update_task_state(task, result)
-
-    def test_nonexistent_file(self, tmp_path: Path) -> None:
-        task = _make_task(file_path=tmp_path / "gone.md")
-        result = _make_result()
+        update_task_state(task, base_result)
+
+    def test_nonexistent_file(
+        self,
+        tmp_path: Path,
+        base_task: Task,
+        base_result: ExecutionResult,
+    ) -> None:
+        task = replace(base_task, file_path=tmp_path / "gone.md")
         # Should not raise
-        update_task_state(task, result)
-
-    def test_next_run_is_written(self, tmp_path: Path) -> None:
+        update_task_state(task, base_result)
+
+    def test_next_run_is_written(
+        self,
+        tmp_path: Path,
+        base_task: Task,
+        base_result: ExecutionResult,
+    ) -> None:
         f = tmp_path / "task.md"
         f.write_text(
             """\
@@ -526,10 +697,9 @@ class TestUpdateTaskStateEdgeCases:
 """,
             encoding="utf-8",
         )
-        task = _make_task(file_path=f, heading_line=0)
-        result = _make_result()
+        task = replace(base_task, file_path=f)
         next_run = datetime(2025, 1, 16, 2, 0, 0)
-        update_task_state(task, result, next_run=next_run)
+        update_task_state(task, base_result, next_run=next_run)
 
         content = f.read_text(encoding="utf-8")
         assert "2025-01-16 02:00:00" in content
@@ -541,13 +711,9 @@ class TestUpdateTaskStateEdgeCases:
 
 
 class TestCreateReport:
-    def test_creates_report_file(self, tmp_path: Path) -> None:
+    def test_creates_report_file(self, tmp_path: Path, base_task: Task) -> None:
         reports_dir = tmp_path / "Reports"
-        task = _make_task(
-            title="Backup Docs",
-            command="echo backup",
-            file_path=tmp_path / "Tasks" / "work.md",
-        )
+        task = replace(base_task, file_path=tmp_path / "Tasks" / "work.md")
         result = _make_result(stdout="Backup complete\n245 files processed")
 
         path = create_report(task, result, reports_dir)
@@ -556,119 +722,105 @@ class TestCreateReport:
         assert path.name == "2025-01-15-103000-backup-docs.md"
         assert path.parent == reports_dir
 
-    def test_report_contains_metadata(self, tmp_path: Path) -> None:
-        reports_dir = tmp_path / "Reports"
-        task = _make_task(
-            file_path=tmp_path / "work.md",
-        )
-        result = _make_result()
-        path = create_report(task, result, reports_dir)
-        content = path.read_text(encoding="utf-8")
-
-        assert "# Backup Docs - Execution Report" in content
-        assert "**Executed:** 2025-01-15 10:30:00" in content
-        assert "**Duration:** 2.5 seconds" in content
-        assert "**Command:** `echo backup`" in content
-        assert "**Exit Code:** 0" in content
-        assert "✅ Success" in content
-
-    def test_report_contains_output(self, tmp_path: Path) -> None:
-        reports_dir = tmp_path / "Reports"
-        task = _make_task(file_path=tmp_path / "work.md")
-        result = _make_result(stdout="Line 1\nLine 2\nLine 3")
-        path = create_report(task, result, reports_dir)
-        content = path.read_text(encoding="utf-8")
-
-        assert "Line 1\nLine 2\nLine 3" in content
-
-    def test_report_contains_backlink(self, tmp_path: Path) -> None:
-        reports_dir = tmp_path / "Reports"
-        task = _make_task(file_path=tmp_path / "Tasks" / "work.md")
-        result = _make_result()
-        path = create_report(task, result, reports_dir)
-        content = path.read_text(encoding="utf-8")
-
-        assert "[[work]]" in content
-
-    def test_failed_report(self, tmp_path: Path) -> None:
-        reports_dir = tmp_path / "Reports"
-        task = _make_task(file_path=tmp_path / "work.md")
-        result = _make_result(
-            success=False,
-            exit_code=1,
-            stdout="",
-            stderr="Permission denied",
-            error_message="Permission denied",
-        )
-        path = create_report(task, result, reports_dir)
-        content = path.read_text(encoding="utf-8")
-
-        assert "❌ Failed" in content
-        assert "**Exit Code:** 1" in content
-        assert "## Errors" in content
-        assert "Permission denied" in content
-
-    def test_no_stderr_section_when_empty(self, tmp_path: Path) -> None:
-        reports_dir = tmp_path / "Reports"
-        task = _make_task(file_path=tmp_path / "work.md")
-        result = _make_result(stderr="")
-        path = create_report(task, result, reports_dir)
-        content = path.read_text(encoding="utf-8")
-
-        assert "## Errors" not in content
-
-    def test_report_ends_with_footer(self, tmp_path: Path) -> None:
-        reports_dir = tmp_path / "Reports"
-        task = _make_task(file_path=tmp_path / "work.md")
-        result = _make_result()
-        path = create_report(task, result, reports_dir)
-        content = path.read_text(encoding="utf-8")
-
-        assert "*Generated by Obsidian Task Automation*" in content
-
-    def test_no_output_placeholder(self, tmp_path: Path) -> None:
-        reports_dir = tmp_path / "Reports"
-        task = _make_task(file_path=tmp_path / "work.md")
-        result = _make_result(stdout="")
-        path = create_report(task, result, reports_dir)
-        content = path.read_text(encoding="utf-8")
-
-        assert "(no output)" in content
+    @pytest.mark.parametrize(
+        "result_kwargs, parameters, present, absent",
+        [
+            (
+                {},
+                None,
+                [
+                    "# Backup Docs - Execution Report",
+                    "**Executed:** 2025-01-15 10:30:00",
+                    "**Duration:** 2.5 seconds",
+                    "**Command:** `echo backup`",
+                    "**Exit Code:** 0",
+                    "✅ Success",
+                    "[[work]]",
+                    "*Generated by Obsidian Task Automation*",
+                ],
+                ["## Errors", "## Parameters"],
+            ),
+            (
+                {"stdout": "Line 1\nLine 2\nLine 3"},
+                None,
+                ["Line 1\nLine 2\nLine 3"],
+                [],
+            ),
+            (
+                {
+                    "success": False,
+                    "exit_code": 1,
+                    "stdout": "",
+                    "stderr": "Permission denied",
+                    "error_message": "Permission denied",
+                },
+                None,
+                ["❌ Failed", "**Exit Code:** 1", "## Errors", "Permission denied"],
+                [],
+            ),
+            ({"stdout": ""}, None, ["(no output)"], []),
+            (
+                {},
+                {"amount": "1234.56", "customer": "Acme Corp"},
+                ["## Parameters", "| amount | 1234.56 |", "| customer | Acme Corp |"],
+                [],
+            ),
+            (
+                {},
+                {"invoice_number": "INV-2026-02"},
+                [
+                    "| Parameter | Value |",
+                    "|-----------|-------|",
+                    "| invoice_number | INV-2026-02 |",
+                ],
+                [],
+            ),
+        ],
+        ids=["metadata", "output", "failed", "no-output", "parameters", "table"],
+    )
+    def test_report_content(
+        self,
+        report_factory: Callable[..., str],
+        result_kwargs: dict[str, Any],
+        parameters: dict[str, str] | None,
+        present: list[str],
+        absent: list[str],
+    ) -> None:
+        content = report_factory(_make_result(**result_kwargs), parameters)
+
+        for fragment in present:
+            assert fragment in content
+        for fragment in absent:
+            assert fragment not in content
+
+    def test_parameters_precede_output(
+        self,
+        report_factory: Callable[..., str],
+        base_result: ExecutionResult,
+    ) -> None:
+        content = report_factory(base_result, {"amount": "1234.56"})
 
-    def test_report_with_parameters(self, tmp_path: Path) -> None:
-        reports_dir = tmp_path / "Reports"
-        task = _make_task(file_path=tmp_path / "work.md")
-        result = _make_result()
-        params = {"amount": "1234.56", "customer": "Acme Corp"}
-        path = create_report(task, result, reports_dir, parameters=params)
-        content = path.read_text(encoding="utf-8")
-
-        assert "## Parameters" in content
-        assert "| amount | 1234.56 |" in content
-        assert "| customer | Acme Corp |" in content
-        # Parameters section should appear before Output
         assert content.index("## Parameters") < content.index("## Output")
 
-    def test_report_without_parameters(self, tmp_path: Path) -> None:
+    def test_create_reports_keeps_job_order(
+        self,
+        tmp_path: Path,
+        base_task: Task,
+        base_result: ExecutionResult,
+    ) -> None:
         reports_dir = tmp_path / "Reports"
-        task = _make_task(file_path=tmp_path / "work.md")
-        result = _make_result()
-        path = create_report(task, result, reports_dir, parameters=None)
-        content = path.read_text(encoding="utf-8")
+        titles = ["Alpha", "Beta", "Gamma"]
+        task = replace(base_task, file_path=tmp_path / "work.md")
+        jobs = [
+            (replace(task, title=t), base_result, reports_dir) for t in titles
+        ]
 
-        assert "## Parameters" not in content
+        paths = create_reports(jobs)
 
-    def test_report_parameters_table_format(self, tmp_path: Path) -> None:
-        reports_dir = tmp_path / "Reports"
-        task = _make_task(file_path=tmp_path / "work.md")
-        result = _make_result()
-        params = {"invoice_number": "INV-2026-02"}
-        path = create_report(task, result, reports_dir, parameters=params)
-        content = path.read_text(encoding="utf-8")
-
-        assert "| Parameter | Value |" in content
-        assert "|-----------|-------|" in content
-        assert "| invoice_number | INV-2026-02 |" in content
+        assert [p.name for p in paths] == [
+            f"2025-01-15-103000-{t.lower()}.md" for t in titles
+        ]
+        assert all(p.exists() for p in paths)
 
 
 # ---------------------------------------------------------------------------
@@ -731,10 +883,11 @@ class TestParseHistoryRows:
 
 
 class TestBuildRunHistoryLines:
-    def test_first_run(self) -> None:
+    def test_first_run(self, base_result: ExecutionResult) -> None:
         """First execution creates a table with one data row."""
-        result = _make_result()
-        lines = build_run_history_lines([], result, "2025-01-15-103000-backup-docs")
+        lines = build_run_history_lines(
+            [], base_result, "2025-01-15-103000-backup-docs"
+        )
         assert lines[0] == "#### Run History"
         assert "| Time |" in lines[1]
         assert lines[2].startswith("|---")
@@ -744,12 +897,11 @@ class TestBuildRunHistoryLines:
         assert "2.5s" in lines[3]
         assert "[[2025-01-15-103000-backup-docs]]" in lines[3]
 
-    def test_prepends_new_row(self) -> None:
+    def test_prepends_new_row(self, base_result: ExecutionResult) -> None:
         """New row appears before existing rows."""
         existing = ["| 2025-01-14 10:00:00 | ✅ | 1.0s | [[old-report]] |"]
-        result = _make_result()
         lines = build_run_history_lines(
-            existing, result, "2025-01-15-103000-backup-docs"
+            existing, base_result, "2025-01-15-103000-backup-docs"
         )
         # 3 header lines + 2 data rows
         assert len(lines) == 5
@@ -758,14 +910,13 @@ class TestBuildRunHistoryLines:
         # Old row second
         assert "2025-01-14 10:00:00" in lines[4]
 
-    def test_truncates_to_max_rows(self) -> None:
+    def test_truncates_to_max_rows(self, base_result: ExecutionResult) -> None:
         """Table never exceeds MAX_HISTORY_ROWS data rows."""
         existing = [
             f"| 2025-01-{i:02d} 00:00:00 | ✅ | 1.0s | [[r{i}]] |"
             for i in range(1, MAX_HISTORY_ROWS + 5)  # 24 rows
         ]
-        result = _make_result()
-        lines = build_run_history_lines(existing, result, "new-report")
+        lines = build_run_history_lines(existing, base_result, "new-report")
         data_rows = [l for l in lines if l.startswith("|") and not l.startswith("|---") and "Time" not in l]
         assert len(data_rows) == MAX_HISTORY_ROWS
 
@@ -775,10 +926,9 @@ class TestBuildRunHistoryLines:
         lines = build_run_history_lines([], result, "report")
         assert "❌" in lines[3]
 
-    def test_without_report_name(self) -> None:
+    def test_without_report_name(self, base_result: ExecutionResult) -> None:
         """When no report is provided, shows '-' instead of link."""
-        result = _make_result()
-        lines = build_run_history_lines([], result, None)
+        lines = build_run_history_lines([], base_result, None)
         # Last column should be "-"
         assert "| - |" in lines[3]
 
@@ -789,13 +939,39 @@ class TestBuildRunHistoryLines:
         assert "123.5s" in lines[3]
 
 
+# ---------------------------------------------------------------------------
+# build_task_sections
+# ---------------------------------------------------------------------------
+
+
+class TestBuildTaskSections:
+    def test_yields_sections_in_file_order(self, base_result: ExecutionResult) -> None:
+        task = _make_task(status=TaskStatus.SUCCESS, total_runs=1, successful_runs=1)
+        sections = list(build_task_sections(task, base_result, [], "report"))
+
+        assert [title for title, _ in sections] == [
+            "Current State",
+            "Statistics",
+            "Run History",
+        ]
+        assert sections[0][1][0] == "#### Current State"
+        assert "✅ Success" in sections[0][1][1]
+        assert sections[1][1][1] == "- Total Runs: 1"
+        assert "[[report]]" in sections[2][1][3]
+
+
 # ---------------------------------------------------------------------------
 # update_task_state — Run History integration
 # ---------------------------------------------------------------------------
 
 
 class TestUpdateTaskStateRunHistory:
-    def test_creates_run_history_section(self, tmp_path: Path) -> None:
+    def test_creates_run_history_section(
+        self,
+        tmp_path: Path,
+        base_task: Task,
+        base_result: ExecutionResult,
+    ) -> None:
         """Run History section is created on first execution."""
         f = tmp_path / "task.md"
         f.write_text(
@@ -806,10 +982,9 @@ class TestUpdateTaskStateRunHistory:
 """,
             encoding="utf-8",
         )
-        task = _make_task(file_path=f)
-        result = _make_result()
+        task = replace(base_task, file_path=f)
         report = tmp_path / "Reports" / "2025-01-15-103000-backup-docs.md"
-        update_task_state(task, result, report_path=report)
+        update_task_state(task, base_result, report_path=report)
 
         content = f.read_text(encoding="utf-8")
         assert "#### Run History" in content
@@ -817,7 +992,7 @@ class TestUpdateTaskStateRunHistory:
         assert "2025-01-15 10:30:00" in content
         assert "[[2025-01-15-103000-backup-docs]]" in content
 
-    def test_accumulates_history_rows(self, tmp_path: Path) -> None:
+    def test_accumulates_history_rows(self, tmp_path: Path, base_task: Task) -> None:
         """Multiple executions add rows to the table."""
         f = tmp_path / "task.md"
         f.write_text(
@@ -829,7 +1004,7 @@ class TestUpdateTaskStateRunHistory:
             encoding="utf-8",
         )
         # Run 1
-        task = _make_task(file_path=f)
+        task = replace(base_task, file_path=f)
         result1 = _make_result(
             duration=1.0,
             stdout="run1",
@@ -845,13 +1020,9 @@ class TestUpdateTaskStateRunHistory:
             duration=1.0,
         )
         report1 = tmp_path / "Reports" / "2025-01-14-100000-backup-docs.md"
-        update_task_state(task, result1, report_path=report1)
-
-        # Run 2
-        from obs_tasks.parser import parse_file
+        task2 = update_task_state(task, result1, report_path=report1)
 
-        tasks = parse_file(f)
-        task2 = tasks[0]
+        # Run 2 (with the task returned by run 1, no re-parse)
         result2 = ExecutionResult(
             task_id="backup-docs",
             success=True,
@@ -874,7 +1045,12 @@ class TestUpdateTaskStateRunHistory:
         idx_old = content.index("2025-01-14 10:00:00")
         assert idx_new < idx_old
 
-    def test_without_report_path(self, tmp_path: Path) -> None:
+    def test_without_report_path(
+        self,
+        tmp_path: Path,
+        base_task: Task,
+        base_result: ExecutionResult,
+    ) -> None:
         """Run History works without a report_path (shows '-')."""
         f = tmp_path / "task.md"
         f.write_text(
@@ -885,15 +1061,19 @@ class TestUpdateTaskStateRunHistory:
 """,
             encoding="utf-8",
         )
-        task = _make_task(file_path=f)
-        result = _make_result()
-        update_task_state(task, result)  # no report_path
+        task = replace(base_task, file_path=f)
+        update_task_state(task, base_result)  # no report_path
 
         content = f.read_text(encoding="utf-8")
         assert "#### Run History" in content
         assert "| - |" in content  # no report link
 
-    def test_max_rows_enforced(self, tmp_path: Path) -> None:
+    def test_max_rows_enforced(
+        self,
+        tmp_path: Path,
+        base_task: Task,
+        base_result: ExecutionResult,
+    ) -> None:
         """Run History table doesn't grow beyond MAX_HISTORY_ROWS."""
         f = tmp_path / "task.md"
         # Build a file with an existing Run History at max capacity
@@ -915,9 +1095,9 @@ class TestUpdateTaskStateRunHistory:
         content += "\n".join(history_rows) + "\n"
         f.write_text(content, encoding="utf-8")
 
-        task = _make_task(file_path=f)
-        result = _make_result()
-        update_task_state(task, result, report_path=tmp_path / "Reports" / "new.md")
+        task = replace(base_task, file_path=f)
+        report = tmp_path / "Reports" / "new.md"
+        update_task_state(task, base_result, report_path=report)
 
         updated = f.read_text(encoding="utf-8")
         # Count data rows (lines starting with "| 20")
@@ -927,7 +1107,12 @@ class TestUpdateTaskStateRunHistory:
         ]
         assert len(data_rows) == MAX_HISTORY_ROWS
 
-    def test_preserves_all_other_sections(self, tmp_path: Path) -> None:
+    def test_preserves_all_other_sections(
+        self,
+        tmp_path: Path,
+        base_task: Task,
+        base_result: ExecutionResult,
+    ) -> None:
         """Run History addition doesn't disturb other sections."""
         f = tmp_path / "task.md"
         f.write_text(
@@ -941,9 +1126,8 @@ Important user notes here.
 """,
             encoding="utf-8",
         )
-        task = _make_task(file_path=f)
-        result = _make_result()
-        update_task_state(task, result)
+        task = replace(base_task, file_path=f)
+        update_task_state(task, base_result)
 
         content = f.read_text(encoding="utf-8")
         assert "#### Notes" in content
@@ -951,3 +1135,169 @@ Important user notes here.
         assert "#### Current State" in content
         assert "#### Statistics" in content
         assert "#### Run History" in content
+
+    def test_rows_read_before_sections_are_replaced(
+        self, base_task: Task, base_result: ExecutionResult
+    ) -> None:
+        # A malformed file where the Statistics range swallows the history
+        # rows: they are read before any section is replaced, so they are
+        # kept instead of being dropped with the old Statistics lines.
+        text = """\
+### Run History
+#### Statistics
+| 2025-01-01 00:00:00 | ✅ | 1.0s | [[r]] |
+"""
+        content = update_task_state_text(text, base_task, base_result)
+        assert content.endswith(
+            "| 2025-01-15 10:30:00 | ✅ | 2.5s | - |\n"
+            "| 2025-01-01 00:00:00 | ✅ | 1.0s | [[r]] |\n"
+        )
+
+
+# ---------------------------------------------------------------------------
+# record_execution
+# ---------------------------------------------------------------------------
+
+
+class TestRecordExecution:
+    def test_writes_report_and_task_state(
+        self,
+        tmp_path: Path,
+        base_task: Task,
+        base_result: ExecutionResult,
+    ) -> None:
+        f = tmp_path / "Tasks" / "work.md"
+        f.parent.mkdir()
+        f.write_text(
+            """\
+#### Task Definition
+- Command: `echo backup`
+- Schedule: 0 2 * * *
+""",
+            encoding="utf-8",
+        )
+        task = replace(base_task, file_path=f)
+
+        report = record_execution(task, base_result, tmp_path / "Reports")
+
+        assert report.name == "2025-01-15-103000-backup-docs.md"
+        assert "[[work]]" in report.read_text(encoding="utf-8")
+        content = f.read_text(encoding="utf-8")
+        assert "✅ Success" in content
+        assert "Total Runs: 1" in content
+        assert f"[[{report.stem}]]" in content
+
+    def test_report_written_without_task_file(
+        self,
+        tmp_path: Path,
+        base_task: Task,
+        base_result: ExecutionResult,
+    ) -> None:
+        task = replace(base_task, file_path=None)
+        report = record_execution(task, base_result, tmp_path / "Reports")
+        assert report.exists()
+
+
+# ---------------------------------------------------------------------------
+# update_task_states
+# ---------------------------------------------------------------------------
+
+
+class TestUpdateTaskStates:
+    def test_same_file_updates_applied_in_order(
+        self,
+        tmp_path: Path,
+        base_task: Task,
+        monkeypatch,
+    ) -> None:
+        f = tmp_path / "work.md"
+        f.write_text(
+            "#### Task Definition\n- Command: `echo backup`\n", encoding="utf-8"
+        )
+        writes: list[Path] = []
+
+        def recording_write(path: Path, content: bytes, durable: bool = True) -> None:
+            writes.append(path)
+            _atomic_write(path, content, durable)
+
+        monkeypatch.setattr("obs_tasks.writer._atomic_write", recording_write)
+        task = replace(base_task, file_path=f)
+        first = _make_result(duration=1.0)
+        second = _make_result(success=False, exit_code=1, duration=2.0)
+
+        updated = update_task_states([(task, first, None), (task, second, None)])
+
+        assert writes == [f]
+        assert [t.status for t in updated] == [TaskStatus.SUCCESS, TaskStatus.FAILED]
+        content = f.read_text(encoding="utf-8")
+        assert content.count("#### Current State") == 1
+        assert "- Status: ❌ Failed" in content
+        assert content.index("| 2.0s |") < content.index("| 1.0s |")
+        assert "- Total Runs: 2" in content
+        assert "- Successful: 1" in content
+        assert "- Failed: 1" in content
+        assert updated[1].total_runs == 2
+
+    def test_single_path_not_resolved(
+        self,
+        tmp_path: Path,
+        base_task: Task,
+        base_result: ExecutionResult,
+        monkeypatch,
+    ) -> None:
+        f = tmp_path / "work.md"
+        f.write_text("- Command: `echo backup`\n", encoding="utf-8")
+
+        def fail_resolve(self: Path, strict: bool = False) -> Path:
+            raise AssertionError("resolve() called for a single path")
+
+        monkeypatch.setattr(Path, "resolve", fail_resolve)
+        task = replace(base_task, file_path=f)
+
+        updated = update_task_states(
+            [(task, base_result, None), (task, base_result, None)]
+        )
+
+        assert updated[1].total_runs == 2
+
+    def test_relative_and_absolute_paths_share_one_write(
+        self,
+        tmp_path: Path,
+        base_task: Task,
+        base_result: ExecutionResult,
+        monkeypatch,
+    ) -> None:
+        f = tmp_path / "work.md"
+        f.write_text("- Command: `echo backup`\n", encoding="utf-8")
+        monkeypatch.chdir(tmp_path)
+
+        updated = update_task_states(
+            [
+                (replace(base_task, file_path=f), base_result, None),
+                (replace(base_task, file_path=Path("work.md")), base_result, None),
+            ]
+        )
+
+        assert updated[1].total_runs == 2
+        content = f.read_text(encoding="utf-8")
+        assert "- Total Runs: 2" in content
+        assert content.count("| 2.5s |") == 2
+
+    def test_results_aligned_with_input(
+        self,
+        tmp_path: Path,
+        base_task: Task,
+        base_result: ExecutionResult,
+    ) -> None:
+        f = tmp_path / "work.md"
+        f.write_text("- Command: `echo backup`\n", encoding="utf-8")
+        updated = update_task_states(
+            [
+                (replace(base_task, file_path=None), base_result, None),
+                (replace(base_task, file_path=f), base_result, None),
+                (replace(base_task, file_path=tmp_path / "gone.md"), base_result, None),
+            ]
+        )
+        assert updated[0] is None
+        assert updated[1] is not None and updated[1].total_runs == 1
+        assert updated[2] is None